@@ -1,7 +1,7 @@
 """
 SCHOOL BELL SYSTEM - MENU DRIVEN APPLICATION
 
-- Bell mode (with in-memory schedules)
+- Bell mode (schedules saved to schedules.json)
 - Assembly mode (manual selection based on today's day)
 - Announcement (placeholder)
 - Settings (change audio files)
@@ -9,11 +9,26 @@ SCHOOL BELL SYSTEM - MENU DRIVEN APPLICATION
 """
 
 import time
-from datetime import datetime, date
-import pygame
+import functools
+import atexit
+import re
+import os
+import json
+import threading
+import select
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from datetime import time as dtime
 import sys
-import time
-import pyttsx3
+
+# pygame and pyttsx3 are heavy (SDL / speech backends); they are imported
+# on first use in init_audio() and _get_engine() so startup stays fast
+pygame = None
+
+try:
+    import msvcrt   # Windows console input
+except ImportError:
+    msvcrt = None
 
 # -------------------------------------------------------------
 # GLOBAL MODE FLAG
@@ -21,37 +36,187 @@ import pyttsx3
 
 CURRENT_MODE = "IDLE"   # IDLE / BELL / ASSEMBLY / ANNOUNCEMENT
 
+# Wakes the background bell thread immediately (set on every mode or
+# schedule change) so it re-checks instead of sleeping until the next bell
+_wake = threading.Event()
+
 def set_mode(mode: str):
     global CURRENT_MODE
+    changed = mode != CURRENT_MODE
     CURRENT_MODE = mode
+    if changed:
+        _wake.set()
     print(f"\n[MODE] Switched to: {CURRENT_MODE}\n")
 
 
+# -------------------------------------------------------------
+# MENU DISPATCH HELPERS
+# -------------------------------------------------------------
+
+_BACK = object()   # returned by a menu action to leave its menu
+
+def _invalid():
+    print("Invalid choice.\n")
+
+def _prompt(msg):
+    """
+    input() on a terminal; a plain readline when stdin is piped, so a
+    list of times can be fed in from a file. Raises EOFError at the end.
+    """
+    if sys.stdin.isatty():
+        return input(msg).strip()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+def _prompt_lower(msg):
+    return _prompt(msg).lower()
+
+
 # -------------------------------------------------------------
 # AUDIO INITIALIZATION
 # -------------------------------------------------------------
 
 _audio_inited = False
+# the menu, the audio worker and the bell thread may all get here first
+_audio_lock = threading.Lock()
 
 def init_audio():
-    global _audio_inited
-    if not _audio_inited:
-        pygame.mixer.init()
+    global _audio_inited, pygame
+    if _audio_inited:
+        return
+    with _audio_lock:
+        if _audio_inited:
+            return
+        import pygame as _pygame
+        pygame = _pygame
+        if not pygame.mixer.get_init():
+            # 512-sample buffer: ~11 ms output latency instead of ~185 ms
+            # with the default; raise to 1024 if playback stutters
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+            pygame.mixer.init()
         _audio_inited = True
 
-def play_audio_blocking(path: str):
-    """Play an audio file fully, blocking until it finishes."""
-    init_audio()
-    pygame.mixer.music.load(path)
-    pygame.mixer.music.play()
-    while pygame.mixer.music.get_busy():
-        time.sleep(0.1)
+atexit.register(lambda: pygame.mixer.quit() if _audio_inited else None)
+
+# path -> decoded pygame.mixer.Sound, so ringing never touches the disk
+_sound_cache = {}
+# the audio worker and the bell scheduler may ask for the same file at once
+_sound_cache_lock = threading.Lock()
+
+def _get_sound(path: str):
+    s = _sound_cache.get(path)
+    if s is None:
+        with _sound_cache_lock:
+            s = _sound_cache.get(path)
+            if s is None:
+                init_audio()    # a Sound needs an open mixer (and pygame)
+                s = pygame.mixer.Sound(path)
+                _sound_cache[path] = s
+    return s
+
+# Set by stop_audio() to cut the current manual playback short
+_stop_playback = threading.Event()
+# Never set: scheduled bells wait on this, so stop_audio() can't mute them
+_no_stop = threading.Event()
+
+def _wait_playback_end(ch, length: float, stop=_no_stop):
+    """
+    Block until channel `ch` finishes playing a sound of `length` seconds,
+    or until the `stop` event is set.
+    Sleeps once for the whole clip and only polls the short tail left by
+    mixer buffering, instead of waking every 100 ms.
+
+    Channel.set_endevent() + pygame.event.wait() is not used on purpose:
+    pygame's event queue needs the video subsystem, which a headless
+    terminal machine may not have.
+    """
+    if ch is None:
+        return
+    wait = stop.wait
+    busy = ch.get_busy
+    stopped = wait(length)
+    while not stopped and busy():
+        stopped = wait(0.02)
+    if stopped:
+        ch.stop()
+
+def _play_to_end(sound, volume=None, stop=_no_stop):
+    """Play a cached Sound and block until it finishes (or `stop` is set)."""
+    ch = sound.play()
+    if ch is not None and volume is not None:
+        ch.set_volume(volume)
+    _wait_playback_end(ch, sound.get_length(), stop)
+
+def play_audio_blocking(path: str, stop=_no_stop):
+    """Play an audio file fully, blocking until it finishes (or `stop` is set)."""
+    _play_to_end(_get_sound(path), stop=stop)
+
+# Single worker so manual playback never overlaps and the menu stays free
+_audio_pool = ThreadPoolExecutor(max_workers=1)
+
+def _submit_audio(fn, *args):
+    """Run a playback function on the audio worker with a fresh stop flag."""
+    _stop_playback.clear()
+    return _audio_pool.submit(fn, *args)
+
+def play_audio_async(path: str):
+    """Start playing an audio file on the audio worker. Returns a Future."""
+    return _submit_audio(play_audio_blocking, path, _stop_playback)
+
+def stop_audio():
+    """Stop whatever the audio worker is currently playing."""
+    _stop_playback.set()
+
+# msvcrt reads single keys; elsewhere stdin is line-buffered
+_STOP_HINT = "S = Stop" if msvcrt is not None else "S + Enter = Stop"
+
+def _read_key(timeout: float):
+    """Return what the user typed within `timeout` seconds, or None."""
+    if msvcrt is not None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                return msvcrt.getwch()
+            time.sleep(0.05)
+        return None
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        return None
+    line = sys.stdin.readline()
+    if not line:            # EOF: stdin stays "ready", don't spin on it
+        time.sleep(timeout)
+        return None
+    return line
+
+def _wait_or_stop(fut):
+    """Wait for a playback Future; the user can type S to stop it."""
+    if not sys.stdin.isatty():
+        # piped input: the next lines are menu choices, don't eat them
+        fut.result()
+        return
+    print(f"Playing... ({_STOP_HINT})")
+    while not fut.done():
+        key = _read_key(0.2)
+        if key and key.strip().lower() == "s":
+            stop_audio()
+            print("Stopped.")
+    fut.result()
+
+def play_audio_stoppable(path: str):
+    """Play an audio file in the background; the user can type S to stop it."""
+    _wait_or_stop(play_audio_async(path))
 
 
 # -------------------------------------------------------------
 # TIME PARSER (for bell times, accepts 9, 9:30, 9am, 9:30 pm, 21:00)
 # -------------------------------------------------------------
 
+# plain 24h 'H:MM' / 'HH:MM' - the common case, needs no am/pm handling
+_HHMM_24H = re.compile(r"([01]?\d|2[0-3]):([0-5]\d)")
+
+@functools.lru_cache(maxsize=256)
 def parse_time_to_24h(t: str) -> str:
     """
     Convert a user time string to 'HH:MM' 24h format.
@@ -59,6 +224,10 @@ def parse_time_to_24h(t: str) -> str:
       '9', '09', '9:00', '9:30', '09:30', '9am', '9 am', '9:30pm', '21:00'
     Raises ValueError if invalid.
     """
+    m = _HHMM_24H.fullmatch(t)
+    if m:
+        return f"{int(m[1]):02d}:{m[2]}"
+
     s = t.strip().lower()
     if not s:
         raise ValueError("Empty time")
@@ -102,102 +271,319 @@ def parse_time_to_24h(t: str) -> str:
 # BELL SCHEDULER
 # -------------------------------------------------------------
 
+_HHMM = re.compile(r"([01]\d|2[0-3]):([0-5]\d)")
+
+@functools.lru_cache(maxsize=32)
+def _parse_time(t: str):
+    """Parse a strict 'HH:MM' (24h) string to (hour, minute), or None if invalid."""
+    m = _HHMM.fullmatch(t)
+    if m is None:
+        return None
+    return (int(m[1]), int(m[2]))
+
+
+# tuple(schedule_list) -> (minute-of-day bitmap, sorted (hour, minute) tuple,
+#                          tuple of invalid strings)
+_schedule_cache = {}
+
+def _parse_schedule(schedule_list):
+    """
+    Validate a schedule list once; repeated lists are served from the cache.
+    Valid times are packed into an int where bit h*60+m is set, and also
+    kept as a sorted, de-duplicated tuple for display.
+    """
+    key = tuple(schedule_list)
+    parsed = _schedule_cache.get(key)
+    if parsed is None:
+        # one regex match per entry, no exceptions for bad input
+        hms = [_parse_time(t) for t in key]
+        bits = 0
+        for h, m in filter(None, hms):
+            bits |= 1 << (h * 60 + m)
+        invalid = tuple(t for t, hm in zip(key, hms) if hm is None)
+        parsed = (bits, tuple(_bell_minutes(bits)), invalid)
+        _schedule_cache[key] = parsed
+    return parsed
+
+
+def _bell_minutes(bits):
+    """Yield (hour, minute) for every set bit of a schedule bitmap, earliest first."""
+    while bits:
+        low = bits & -bits
+        yield divmod(low.bit_length() - 1, 60)
+        bits ^= low
+
+
+def _todays_bells(schedule, day, now):
+    """
+    Pending bells for `day` as a minute-of-day bitmap: the schedule with
+    every minute before `now` cleared. The lowest set bit is the next bell.
+    """
+    if day == now.date():
+        schedule &= ~((1 << (now.hour * 60 + now.minute)) - 1)
+    return schedule
+
+
+# Bells due while these modes are using the speakers are skipped, not deferred
+_BELL_MUTED_MODES = ("ASSEMBLY", "ANNOUNCEMENT")
+
+# The running schedule, owned by the background bell thread.
+# UI code replaces it under _bell_lock, bumps the version and sets _wake.
+_bell_lock = threading.Lock()
+_bell_job = None            # (bitmap, Sound, volume, today_only, start date)
+_bell_job_version = 0
+_bell_thread = None
+# saved schedule the job came from (None for today-only times), so editing
+# or deleting that schedule also updates or stops the running job
+_running_schedule_name = None
+
+
+def _set_bell_job(job):
+    global _bell_job, _bell_job_version
+    with _bell_lock:
+        _bell_job = job
+        _bell_job_version += 1
+    _wake.set()
+
+
+def _bell_worker():
+    """Background loop: sleep until the next bell of the current job, ring it."""
+    global _bell_job
+
+    # bind hot-loop lookups to locals once
+    _now = datetime.now
+    _wait = _wake.wait
+    _clear = _wake.clear
+    _ring = _play_to_end
+
+    version = -1
+    job = None
+    pending = 0
+    today_date = None
+
+    while True:
+        # one clock read per pass; the date is derived from it
+        now = _now()
+        today = now.date()
+
+        with _bell_lock:
+            if version != _bell_job_version:
+                version = _bell_job_version
+                job = _bell_job
+                if job is not None:
+                    today_date = job[4]
+                    pending = _todays_bells(job[0], today_date, now)
+
+        if job is None:
+            # nothing scheduled -> sleep until the UI hands us a job
+            if _wait():
+                _clear()
+            continue
+
+        schedule, bell, volume, today_only, _ = job
+
+        # date changed -> stop (today_only) or rebuild for the new day
+        if today != today_date:
+            if today_only:
+                print("\nDate changed. Today-only bell schedule finished.")
+                with _bell_lock:
+                    if version == _bell_job_version:
+                        _bell_job = None
+                job = None
+                continue
+            today_date = today
+            pending = _todays_bells(schedule, today_date, now)
+            continue
+
+        # nothing left today -> sleep until midnight
+        if pending:
+            low = pending & -pending
+            h, m = divmod(low.bit_length() - 1, 60)
+            next_dt = datetime.combine(today_date, dtime(h, m))
+        else:
+            next_dt = datetime.combine(today_date + timedelta(days=1), dtime())
+
+        delay = (next_dt - now).total_seconds()
+        if delay > 0:
+            # Far from the bell: wake 30 s early (at most hourly) and
+            # re-read the wall clock, so clock adjustments made during
+            # a long monotonic wait can't make the bell late.
+            if delay > 60:
+                delay = min(delay - 30, 3600)
+            # woken early by a mode or schedule change -> just re-check
+            if _wait(delay):
+                _clear()
+            continue
+
+        pending ^= low
+
+        # Assembly / announcement in progress, skip this bell
+        if CURRENT_MODE in _BELL_MUTED_MODES:
+            continue
+
+        # Its minute is already over (system was asleep or the clock
+        # jumped forward): skip it rather than ring a burst of old bells
+        if delay <= -60:
+            print(f"\nMissed bell at {next_dt.hour:02d}:{next_dt.minute:02d}, skipping")
+            continue
+
+        print(f"\nRinging bell at {next_dt.hour:02d}:{next_dt.minute:02d}")
+        try:
+            _ring(bell, volume)
+        except Exception as e:
+            # keep the scheduler alive for the next bell
+            print("Bell playback error:", e)
+
+
 def ringBell(schedule_list, audio_file='bell.mp3',
-             check_interval=20, volume=0.8, today_only=False):
+             check_interval=20, volume=0.8, today_only=False,
+             parsed_schedule=None, schedule_name=None):
     """
     Bell scheduler:
     - schedule_list: list of 'HH:MM' strings (24h).
-    - Rings ONLY when CURRENT_MODE == "BELL".
+    - parsed_schedule: optional _parse_schedule() result for schedule_list,
+      skips parsing (saved schedules are parsed when they are saved).
+    - schedule_name: the saved schedule being run, if any; later edits to
+      it are applied to the running job.
+    - Hands the schedule to the background bell thread and returns at once;
+      it replaces any schedule already running (see stop_bells()).
+    - Bells are skipped while in ASSEMBLY or ANNOUNCEMENT mode.
     - If today_only=True, stops automatically when the date changes.
+    - check_interval is kept for compatibility and is no longer used.
     """
+    global _bell_thread, _running_schedule_name
+
     if not schedule_list:
         print("No times given. Returning.")
         return
 
-    init_audio()
-    pygame.mixer.music.set_volume(volume)
+    bell = _get_sound(audio_file)
 
-    # validate and convert to set of (hour, minute)
-    schedule = set()
-    for t in schedule_list:
-        try:
-            h, m = map(int, t.split(":"))
-            if not (0 <= h <= 23 and 0 <= m <= 59):
-                raise ValueError
-            schedule.add((h, m))
-        except Exception:
-            print(f"Invalid time format '{t}', must be HH:MM (24h)")
+    # validate and convert to a minute-of-day bitmap
+    if parsed_schedule is None:
+        parsed_schedule = _parse_schedule(schedule_list)
+    schedule, times, invalid = parsed_schedule
+    for t in invalid:
+        print(f"Invalid time format '{t}', must be HH:MM (24h)")
     if not schedule:
         print("No valid times after parsing. Returning.")
         return
 
-    formatted = [format_time_tuple(h, m) for (h, m) in sorted(schedule)]
+    formatted = [format_time_tuple(h, m) for (h, m) in times]
     print("Bell schedule at:", ", ".join(formatted))
-    print("Scheduler running... (Ctrl+C to stop)\n")
 
-    rung_today = set()
-    start_date = date.today()
-
-    try:
-        while True:
-            # If not in BELL mode, do nothing but wait
-            if CURRENT_MODE != "BELL":
-                time.sleep(check_interval)
-                continue
-
-            now = datetime.now()
-
-            # if today_only and date changed -> stop
-            if today_only and date.today() != start_date:
-                print("Date changed. Today-only bell scheduler stopping.")
-                break
+    _set_bell_job((schedule, bell, volume, today_only, date.today()))
+    _running_schedule_name = schedule_name
+    if _bell_thread is None or not _bell_thread.is_alive():
+        _bell_thread = threading.Thread(target=_bell_worker, name="bell-scheduler",
+                                        daemon=True)
+        _bell_thread.start()
+    print("Scheduler running in the background.\n")
 
-            # reset rung_today at midnight anyway
-            if date.today() != start_date and not today_only:
-                start_date = date.today()
-                rung_today.clear()
 
-            hm = (now.hour, now.minute)
-            if hm in schedule and hm not in rung_today:
-                print(f"Ringing bell at {hm[0]:02d}:{hm[1]:02d}")
-                pygame.mixer.music.load(audio_file)
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.05)
-                rung_today.add(hm)
+def stop_bells():
+    """Stop the running bell schedule, if any."""
+    global _running_schedule_name
+    _running_schedule_name = None
+    _set_bell_job(None)
 
-            time.sleep(check_interval)
 
-    except KeyboardInterrupt:
-        print("Bell scheduler stopped.\n")
+def _reschedule_running(parsed_schedule):
+    """Swap new times into the running job, keeping its sound and options."""
+    with _bell_lock:
+        job = _bell_job
+    if job is None:
+        return
+    if not parsed_schedule[0]:
+        print("Schedule has no valid times left; stopping it.")
+        stop_bells()
+        return
+    _set_bell_job((parsed_schedule[0],) + job[1:])
 
 
 # -------------------------------------------------------------
-# IN-MEMORY BELL SCHEDULES (ONLY PYTHON)
+# BELL SCHEDULES (kept in memory, written through to schedules.json)
 # -------------------------------------------------------------
 
-BELL_SCHEDULES = {
+SCHEDULES_FILE = "schedules.json"
+
+DEFAULT_SCHEDULES = {
     "Regular Day": ["08:30", "09:30", "10:30", "11:30", "12:30"],
     "Short Friday": ["08:30", "09:15", "10:00", "10:45"]
 }
 
+def _valid_schedules(data):
+    """True if `data` is a {name: [time string, ...]} dict."""
+    return isinstance(data, dict) and all(
+        isinstance(times, list) and all(isinstance(t, str) for t in times)
+        for times in data.values())
+
+def _load_schedules():
+    """Read the saved schedules once at startup; fall back to the defaults."""
+    try:
+        with open(SCHEDULES_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if _valid_schedules(data):
+            return data
+        print(f"{SCHEDULES_FILE} has an unexpected format, using default schedules.")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Could not read {SCHEDULES_FILE} ({e}), using default schedules.")
+    return {name: list(times) for name, times in DEFAULT_SCHEDULES.items()}
+
+def _save_schedules():
+    """Write BELL_SCHEDULES to disk; called only after a change."""
+    tmp = SCHEDULES_FILE + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(BELL_SCHEDULES, f, indent=2)
+        os.replace(tmp, SCHEDULES_FILE)   # never leave a half-written file
+    except OSError as e:
+        print(f"Could not save schedules to {SCHEDULES_FILE}: {e}")
+
+BELL_SCHEDULES = _load_schedules()
+
+# name -> _parse_schedule() result, kept in step with BELL_SCHEDULES
+_PARSED_SCHEDULES = {name: _parse_schedule(times)
+                     for name, times in BELL_SCHEDULES.items()}
+
 def list_schedule_names():
     return list(BELL_SCHEDULES.keys())
 
 def get_schedule(name):
     return BELL_SCHEDULES.get(name, None)
 
+def get_parsed_schedule(name):
+    return _PARSED_SCHEDULES.get(name, None)
+
 def update_schedule(name, time_list):
     BELL_SCHEDULES[name] = time_list
+    _PARSED_SCHEDULES[name] = _parse_schedule(time_list)
+    _save_schedules()
+    if name == _running_schedule_name:
+        _reschedule_running(_PARSED_SCHEDULES[name])
 
 def rename_schedule(old_name, new_name):
+    global _running_schedule_name
+    if old_name == new_name:
+        return      # assign-then-del below would delete it
     if old_name in BELL_SCHEDULES:
         BELL_SCHEDULES[new_name] = BELL_SCHEDULES[old_name]
         del BELL_SCHEDULES[old_name]
+        _PARSED_SCHEDULES[new_name] = _PARSED_SCHEDULES.pop(old_name)
+        _save_schedules()
+        if old_name == _running_schedule_name:
+            _running_schedule_name = new_name
 
 def delete_schedule(name):
     if name in BELL_SCHEDULES:
         del BELL_SCHEDULES[name]
+        _PARSED_SCHEDULES.pop(name, None)
+        _save_schedules()
+        if name == _running_schedule_name:
+            stop_bells()
+            print(f"Stopped the running '{name}' schedule.")
 
 
 # -------------------------------------------------------------
@@ -209,35 +595,113 @@ ASSEMBLY_BELL_FILE   = "bell.mp3"               # COMMON
 EXTRA1_FILE = None
 EXTRA2_FILE = None
 
-# Day config: Monday = 0
-DAY_CONFIG = {
-    0: {"label": "English Day",   "prayer": "english_prayer.mp3",   "birthday": "english_birthday.mp3"},
-    1: {"label": "English Day",   "prayer": "english_prayer.mp3",   "birthday": "english_birthday.mp3"},
-    2: {"label": "Hindi Day",     "prayer": "hindi_prayer.mp3",     "birthday": "hindi_birthday.mp3"},
-    3: {"label": "English Day",   "prayer": "english_prayer.mp3",   "birthday": "english_birthday.mp3"},
-    4: {"label": "Malayalam Day", "prayer": "malayalam_prayer.mp3", "birthday": "malayalam_birthday.mp3"}
-}
+# Day config: Monday = 0, one slot per weekday ("" = no assembly that day)
+_LABELS    = ["English Day",        "English Day",        "Hindi Day",
+              "English Day",        "Malayalam Day",      "", ""]
+_PRAYERS   = ["english_prayer.mp3", "english_prayer.mp3", "hindi_prayer.mp3",
+              "english_prayer.mp3", "malayalam_prayer.mp3", "", ""]
+_BIRTHDAYS = ["english_birthday.mp3", "english_birthday.mp3", "hindi_birthday.mp3",
+              "english_birthday.mp3", "malayalam_birthday.mp3", "", ""]
 
-DAY_NAMES = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"]
+DAY_NAMES = ("Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday")
+
+def _build_day_config():
+    """
+    Freeze the per-day lists into a 7-slot tuple of ready-made
+    get_today_assembly_config() results (None = no assembly that day).
+    Rebuilt whenever settings edit a day.
+    """
+    return tuple(
+        (idx, DAY_NAMES[idx], (_LABELS[idx], _PRAYERS[idx], _BIRTHDAYS[idx]))
+        if _PRAYERS[idx] else None
+        for idx in range(7)
+    )
+
+_DAY_CONFIG_TUP = _build_day_config()
+
+# (date, result) of the last get_today_assembly_config() call
+_assembly_cache = None
 
 def get_today_assembly_config():
-    idx = datetime.now().weekday()
-    if idx not in DAY_CONFIG:
+    global _assembly_cache
+    today = date.today()
+    if _assembly_cache and _assembly_cache[0] == today:
+        return _assembly_cache[1]
+
+    idx = today.weekday()
+    result = _DAY_CONFIG_TUP[idx]
+    if result is None:
         raise ValueError(f"No assembly config for {DAY_NAMES[idx]}")
-    return idx, DAY_NAMES[idx], DAY_CONFIG[idx]
+    _assembly_cache = (today, result)
+    return result
+
+def ring_assembly_bell(duration=5, stop=_no_stop):
+    """
+    Ring the assembly bell for `duration` seconds, or less if the clip
+    ends first or the `stop` event is set.
+    """
+    sound = _get_sound(ASSEMBLY_BELL_FILE)
+    # deadline on the monotonic clock, re-waiting if woken early
+    deadline = time.monotonic() + duration
+    ch = sound.play()
+    if ch is None:
+        return
+    stop.wait(min(sound.get_length(), duration))
+    while ch.get_busy() and not stop.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        stop.wait(min(remaining, 0.02))
+    ch.stop()
 
-def ring_assembly_bell(duration=5):
-    init_audio()
-    pygame.mixer.music.load(ASSEMBLY_BELL_FILE)
-    pygame.mixer.music.play()
-    time.sleep(duration)
-    pygame.mixer.music.stop()
+def ring_assembly_bell_stoppable(duration=5):
+    """Ring the assembly bell on the audio worker; the user can type S to stop it."""
+    _wait_or_stop(_submit_audio(ring_assembly_bell, duration, _stop_playback))
 
 
 # -------------------------------------------------------------
 # ASSEMBLY MENU
 # -------------------------------------------------------------
 
+def _play_extra(path, n):
+    if path:
+        play_audio_stoppable(path)
+    else:
+        print(f"Extra Audio {n} not set.")
+
+def _leave_assembly(cfg):
+    set_mode("IDLE")
+    return _BACK
+
+# choice -> action(cfg), where cfg is today's (label, prayer, birthday)
+_ASSEMBLY_ACTIONS = {
+    "1": lambda cfg: play_audio_stoppable(cfg[1]),
+    "2": lambda cfg: play_audio_stoppable(cfg[2]),
+    "3": lambda cfg: play_audio_stoppable(NATIONAL_ANTHEM_FILE),
+    "4": lambda cfg: _play_extra(EXTRA1_FILE, 1),
+    "5": lambda cfg: _play_extra(EXTRA2_FILE, 2),
+    "6": lambda cfg: ring_assembly_bell_stoppable(5),
+    "0": _leave_assembly,
+}
+
+_ASSEMBLY_TMPL = """
+========== ASSEMBLY MODE ==========
+Today: {day} ({label})
+Prayer file      : {prayer}
+Birthday file    : {birthday}
+National Anthem  : {anthem}
+Extra 1          : {extra1}
+Extra 2          : {extra2}
+-----------------------------------
+1. Play Prayer
+2. Play Birthday Song
+3. Play National Anthem
+4. Play Extra Audio 1
+5. Play Extra Audio 2
+6. Ring Bell (5 sec)
+0. Back to Main Menu
+"""
+
 def assembly_menu():
     set_mode("ASSEMBLY")
 
@@ -249,119 +713,147 @@ def assembly_menu():
             input("Press Enter to return.")
             return
 
-        print("\n========== ASSEMBLY MODE ==========")
-        print(f"Today: {day_name} ({cfg['label']})")
-        print("Prayer file      :", cfg["prayer"])
-        print("Birthday file    :", cfg["birthday"])
-        print("National Anthem  :", NATIONAL_ANTHEM_FILE)
-        print("Extra 1          :", EXTRA1_FILE or "(not set)")
-        print("Extra 2          :", EXTRA2_FILE or "(not set)")
-        print("-----------------------------------")
-        print("1. Play Prayer")
-        print("2. Play Birthday Song")
-        print("3. Play National Anthem")
-        print("4. Play Extra Audio 1")
-        print("5. Play Extra Audio 2")
-        print("6. Ring Bell (5 sec)")
-        print("0. Back to Main Menu")
+        label, prayer, birthday = cfg
+        sys.stdout.write(_ASSEMBLY_TMPL.format(
+            day=day_name, label=label, prayer=prayer, birthday=birthday,
+            anthem=NATIONAL_ANTHEM_FILE,
+            extra1=EXTRA1_FILE or "(not set)",
+            extra2=EXTRA2_FILE or "(not set)"))
+        sys.stdout.flush()
 
         choice = input("Choose: ").strip()
+        action = _ASSEMBLY_ACTIONS.get(choice)
+        if action is None:
+            _invalid()
+        elif action(cfg) is _BACK:
+            return
 
-        if choice == "1":
-            play_audio_blocking(cfg["prayer"])
 
-        elif choice == "2":
-            play_audio_blocking(cfg["birthday"])
+# -------------------------------------------------------------
+# TEXT-TO-SPEECH (ANNOUNCEMENTS) - NAVTEJ'S MODULE (SAFE VERSION)
+# -------------------------------------------------------------
 
-        elif choice == "3":
-            play_audio_blocking(NATIONAL_ANTHEM_FILE)
+_TTS_ENGINE = None
+_TTS_VOICES = None
 
-        elif choice == "4":
-            if EXTRA1_FILE:
-                play_audio_blocking(EXTRA1_FILE)
-            else:
-                print("Extra Audio 1 not set.")
+def _get_engine():
+    """Create the TTS engine once and reuse it (init is slow on every backend)."""
+    global _TTS_ENGINE, _TTS_VOICES
+    if _TTS_ENGINE is None:
+        import pyttsx3
+        _TTS_ENGINE = pyttsx3.init()
+        _TTS_VOICES = _TTS_ENGINE.getProperty("voices")
+        atexit.register(_TTS_ENGINE.stop)
+    return _TTS_ENGINE, _TTS_VOICES
 
-        elif choice == "5":
-            if EXTRA2_FILE:
-                play_audio_blocking(EXTRA2_FILE)
-            else:
-                print("Extra Audio 2 not set.")
 
-        elif choice == "6":
-            ring_assembly_bell(5)
+def _apply_voice(engine, voices, voice_index: int, rate: int):
+    if voice_index < 0 or voice_index >= len(voices):
+        voice_index = 0  # fallback
+    engine.setProperty("voice", voices[voice_index].id)
+    engine.setProperty("rate", rate)
 
-        elif choice == "0":
-            set_mode("IDLE")
-            return
 
-        else:
-            print("Invalid choice.\n")
+# Messages waiting to be spoken: (text, voice_index, rate)
+_tts_queue = []
 
+def queue_say(text: str, voice_index: int, rate: int):
+    """Add a message to the announcement queue; flush_tts() speaks it."""
+    _tts_queue.append((text, voice_index, rate))
 
-# -------------------------------------------------------------
-# TEXT-TO-SPEECH (ANNOUNCEMENTS) - NAVTEJ'S MODULE (SAFE VERSION)
-# -------------------------------------------------------------
 
-def speak_with_voice(text: str, voice_index: int, rate: int):
-    """Generic helper to speak text with a given voice index and rate."""
+def flush_tts():
+    """
+    Speak every queued message in one engine.runAndWait() pass, instead of
+    restarting the engine's event loop per message. Voice and rate are
+    only set again when they change between consecutive messages.
+    """
+    if not _tts_queue:
+        return
+    items = _tts_queue[:]
+    _tts_queue.clear()
     try:
-        engine = pyttsx3.init()
-        voices = engine.getProperty("voices")
+        engine, voices = _get_engine()
 
         if not voices:
             print("No TTS voices found.")
             return
 
-        if voice_index < 0 or voice_index >= len(voices):
-            voice_index = 0  # fallback
-
-        engine.setProperty("voice", voices[voice_index].id)
-        engine.setProperty("rate", rate)
-        engine.say(text)
+        current = None
+        for text, voice_index, rate in items:
+            if (voice_index, rate) != current:
+                _apply_voice(engine, voices, voice_index, rate)
+                current = (voice_index, rate)
+            engine.say(text)
         engine.runAndWait()
-        engine.stop()
     except Exception as e:
         print("TTS error:", e)
 
 
+def speak_with_voice(text: str, voice_index: int, rate: int):
+    """
+    Generic helper to speak text with a given voice index and rate.
+    Goes through the announcement queue, so anything already queued is
+    spoken first in the same pass.
+    """
+    queue_say(text, voice_index, rate)
+    flush_tts()
+
+
+# (voice_index, rate) of each announcer voice
+ROBERT_VOICE = (0, 165)   # usually first voice
+ZARA_VOICE   = (1, 185)   # second voice if available, else falls back to first
+ORION_VOICE  = (0, 140)   # first voice but slower, sounds more serious
+
+
 def speak_robert(text: str):
     """Voice 1 – Robert (usually male default)."""
-    # Usually first voice
-    speak_with_voice(text, voice_index=0, rate=165)
+    speak_with_voice(text, *ROBERT_VOICE)
 
 
 def speak_zara(text: str):
     """Voice 2 – Zara (usually female default)."""
-    # Use second voice if available, else fallback to first
-    speak_with_voice(text, voice_index=1, rate=185)
+    speak_with_voice(text, *ZARA_VOICE)
 
 
 def speak_orion(text: str):
     """Voice 3 – Orion – deeper & slower."""
-    # Reuse first voice but slower, sounds more serious
-    speak_with_voice(text, voice_index=0, rate=140)
+    speak_with_voice(text, *ORION_VOICE)
 
 
+# choice -> (voice_index, rate) used to speak the message
+_ANNOUNCE_VOICES = {
+    "1": ROBERT_VOICE,
+    "2": ZARA_VOICE,
+    "3": ORION_VOICE,
+}
 
+_ANNOUNCEMENT_MENU = """
+========== ANNOUNCEMENT MODE ==========
+Choose a voice for the announcement:
+1. Robert  – Formal male voice
+2. Zara    – Energetic female voice
+3. Orion   – Deep slower voice
+0. Back to Main Menu
+"""
 
 def announcement_menu():
     set_mode("ANNOUNCEMENT")
 
     while True:
-        print("\n========== ANNOUNCEMENT MODE ==========")
-        print("Choose a voice for the announcement:")
-        print("1. Robert  – Formal male voice")
-        print("2. Zara    – Energetic female voice")
-        print("3. Orion   – Deep slower voice")
-        print("0. Back to Main Menu")
+        sys.stdout.write(_ANNOUNCEMENT_MENU)
+        sys.stdout.flush()
         choice = input("Choose: ").strip()
 
         if choice == "0":
+            if _tts_queue:
+                print(f"Discarded {len(_tts_queue)} queued message(s).")
+                _tts_queue.clear()
             set_mode("IDLE")
             return
 
-        if choice not in ("1", "2", "3"):
+        voice = _ANNOUNCE_VOICES.get(choice)
+        if voice is None:
             print("Invalid choice.")
             continue
 
@@ -373,322 +865,340 @@ def announcement_menu():
             print("No message entered. Cancelled.")
             continue
 
-        print("\nAnnouncing...")
-        try:
-            if choice == "1":
-                speak_robert(msg)
-            elif choice == "2":
-                speak_zara(msg)
-            elif choice == "3":
-                speak_orion(msg)
-        except Exception as e:
-            print("Error while speaking:", e)
+        queue_say(msg, *voice)
+        print(f"\n{len(_tts_queue)} message(s) queued.")
+        print("1. Play now")
+        print("2. Queue another message")
+        if input("Choose: ").strip() == "2":
+            continue
 
+        print("\nAnnouncing...")
+        flush_tts()
 
 
 # -------------------------------------------------------------
 # SETTINGS MENU
 # -------------------------------------------------------------
 
-def settings_menu():
-    global NATIONAL_ANTHEM_FILE, ASSEMBLY_BELL_FILE, EXTRA1_FILE, EXTRA2_FILE
+def _ask_new_file(prompt, old):
+    """Ask for a replacement audio file; returns `old` if left blank."""
+    p = input(prompt).strip()
+    if not p:
+        return old
+    _sound_cache.pop(old, None)
+    return p
 
-    while True:
-        print("\n========== SETTINGS ==========")
-        print("1. Change National Anthem file (COMMON)")
-        print("2. Change Assembly Bell file (COMMON)")
-        print("3. Set Extra Audio 1")
-        print("4. Set Extra Audio 2")
-        print("5. Change Prayer/Birthday file for a specific day")
-        print("0. Back")
-        choice = input("Choose: ").strip()
+def _set_anthem_file():
+    global NATIONAL_ANTHEM_FILE
+    NATIONAL_ANTHEM_FILE = _ask_new_file("New anthem file: ", NATIONAL_ANTHEM_FILE)
 
-        if choice == "1":
-            p = input("New anthem file: ").strip()
-            if p: NATIONAL_ANTHEM_FILE = p
+def _set_assembly_bell_file():
+    global ASSEMBLY_BELL_FILE
+    ASSEMBLY_BELL_FILE = _ask_new_file("New assembly bell file: ", ASSEMBLY_BELL_FILE)
 
-        elif choice == "2":
-            p = input("New assembly bell file: ").strip()
-            if p: ASSEMBLY_BELL_FILE = p
+def _set_extra1_file():
+    global EXTRA1_FILE
+    EXTRA1_FILE = _ask_new_file("Extra Audio 1 file: ", EXTRA1_FILE)
 
-        elif choice == "3":
-            p = input("Extra Audio 1 file: ").strip()
-            if p: EXTRA1_FILE = p
+def _set_extra2_file():
+    global EXTRA2_FILE
+    EXTRA2_FILE = _ask_new_file("Extra Audio 2 file: ", EXTRA2_FILE)
 
-        elif choice == "4":
-            p = input("Extra Audio 2 file: ").strip()
-            if p: EXTRA2_FILE = p
+def _set_day_files():
+    global _DAY_CONFIG_TUP, _assembly_cache
 
-        elif choice == "5":
-            print("Days: 0=Mon 1=Tue 2=Wed 3=Thu 4=Fri 5=Sat 6=Sun")
-            try:
-                d = int(input("Day index: ").strip())
-            except:
-                print("Invalid day.")
-                continue
+    print("Days: 0=Mon 1=Tue 2=Wed 3=Thu 4=Fri 5=Sat 6=Sun")
+    try:
+        d = int(input("Day index: ").strip())
+    except:
+        print("Invalid day.")
+        return
 
-            if d not in DAY_CONFIG:
-                DAY_CONFIG[d] = {"label": "", "prayer": "", "birthday": ""}
+    if not 0 <= d <= 6:
+        print("Invalid day.")
+        return
 
-            new_prayer = input("New prayer file (blank=no change): ").strip()
-            new_bday   = input("New birthday file (blank=no change): ").strip()
-            new_label  = input("New label (blank=no change): ").strip()
+    new_prayer = input("New prayer file (blank=no change): ").strip()
+    new_bday   = input("New birthday file (blank=no change): ").strip()
+    new_label  = input("New label (blank=no change): ").strip()
+
+    if new_prayer:
+        _sound_cache.pop(_PRAYERS[d], None)
+        _PRAYERS[d] = new_prayer
+    if new_bday:
+        _sound_cache.pop(_BIRTHDAYS[d], None)
+        _BIRTHDAYS[d] = new_bday
+    if new_label:
+        _LABELS[d] = new_label
+
+    _DAY_CONFIG_TUP = _build_day_config()
+    _assembly_cache = None
+
+_SETTINGS_ACTIONS = {
+    "1": _set_anthem_file,
+    "2": _set_assembly_bell_file,
+    "3": _set_extra1_file,
+    "4": _set_extra2_file,
+    "5": _set_day_files,
+    "0": lambda: _BACK,
+}
 
-            if new_prayer:
-                DAY_CONFIG[d]["prayer"] = new_prayer
-            if new_bday:
-                DAY_CONFIG[d]["birthday"] = new_bday
-            if new_label:
-                DAY_CONFIG[d]["label"] = new_label
+_SETTINGS_MENU = """
+========== SETTINGS ==========
+1. Change National Anthem file (COMMON)
+2. Change Assembly Bell file (COMMON)
+3. Set Extra Audio 1
+4. Set Extra Audio 2
+5. Change Prayer/Birthday file for a specific day
+0. Back
+"""
 
-        elif choice == "0":
+def settings_menu():
+    while True:
+        sys.stdout.write(_SETTINGS_MENU)
+        sys.stdout.flush()
+        choice = input("Choose: ").strip()
+        if _SETTINGS_ACTIONS.get(choice, _invalid)() is _BACK:
             return
 
-        else:
-            print("Invalid choice.\n")
-
 #--------------------------------------------------------------
 #Add a small helper function to format time
 #--------------------------------------------------------------
 
 def format_time_tuple(h, m):
-    suffix = "AM"
-    if h == 0:
-        hour = 12
-    elif h < 12:
-        hour = h
-    elif h == 12:
-        hour = 12
-        suffix = "PM"
-    else:
-        hour = h - 12
-        suffix = "PM"
-    return f"{hour}:{m:02d} {suffix}"
+    # 0 -> 12 AM, 1..11 -> AM, 12 -> 12 PM, 13..23 -> 1..11 PM
+    return f"{(h + 11) % 12 + 1}:{m:02d} {'PM' if h >= 12 else 'AM'}"
 
 # -------------------------------------------------------------
 # BELL MENU (OPTION 1) - NEW VERSION
 # -------------------------------------------------------------
 
-def bell_menu():
-    set_mode("BELL")
-
+def _read_times():
+    """
+    Read bell times until 'done' (or end of piped input).
+    Returns the valid ones as canonical 'HH:MM' strings.
+    """
+    times = []
     while True:
-        print("\n========== BELL MODE ==========")
-        print("1. Set Today's Bell Times (only for today)")
-        print("2. Use a Saved Schedule")
-        print("3. Edit a Schedule (rename / timings)")
-        print("4. Create New Schedule")
-        print("5. Delete a Schedule")
-        print("0. Back to Main Menu")
+        try:
+            t = _prompt_lower("Time: ")
+        except EOFError:
+            break
+        if t == "done":
+            break
+        try:
+            times.append(parse_time_to_24h(t))
+        except Exception as e:
+            print("Invalid time:", e)
+    return times
 
-        choice = input("Choose: ").strip()
 
-        # 1. Today's bell times (temporary)
-        if choice == "1":
-            todays_times = []
-            print("\nEnter today's bell times.")
-            print("Examples: 9, 9:30, 9am, 9:30pm, 14:00")
-            print("Type 'done' when finished.\n")
-            while True:
-                t = input("Time: ").strip()
-                if t.lower() == "done":
-                    break
-                try:
-                    canonical = parse_time_to_24h(t)
-                    todays_times.append(canonical)
-                except Exception as e:
-                    print("Invalid time:", e)
-
-            print("\nToday's Bell Times:", todays_times)
-            if todays_times:
-                print("Starting today-only scheduler... (Ctrl+C to stop)\n")
-                ringBell(todays_times, today_only=True)
-            else:
-                print("No times entered.")
- 
-        #Saved Schedules: IF WE ENTERS 0 ITS A BUG WHERE THE LAST Saved Schedu BELL WORKS (EVERY WHERE)
-        #FIXED 
-        # 2. Use saved schedule (FIXED)
-        elif choice == "2":
-            names = list_schedule_names()
-            if not names:
-                print("No saved schedules.")
-                continue
+def _pick_schedule(heading, empty_msg):
+    """
+    List the saved schedules and let the user pick one.
+    Returns the schedule name, or None for Back / invalid input.
+    """
+    names = list_schedule_names()
+    if not names:
+        print(empty_msg)
+        return None
 
-            print("\nSaved Schedules:")
-            for i, n in enumerate(names):
-                 print(f"{i+1}. {n}") 
-            print("0. Back") 
+    print(f"\n{heading}:")
+    for i, n in enumerate(names):
+        print(f"{i+1}. {n}")
+    print("0. Back")
 
-            choice_idx = input("Choose: ").strip()
+    choice_idx = input("Choose: ").strip()
 
-            if choice_idx == "0":
-                continue  # safely return to Bell menu
+    # '0' must go back without touching any schedule (this used to run the
+    # last saved schedule)
+    if choice_idx == "0":
+        return None
 
-            if not choice_idx.isdigit():
-                print("Invalid choice.")
-                continue
+    if not choice_idx.isdigit():
+        print("Invalid choice.")
+        return None
 
-            idx = int(choice_idx)
+    idx = int(choice_idx)
 
-            if idx < 1 or idx > len(names):
-                print("Invalid choice.")
-                continue
+    if idx < 1 or idx > len(names):
+        print("Invalid choice.")
+        return None
 
-            name = names[idx - 1]  # safe now
+    return names[idx - 1]
 
-            times = get_schedule(name)
-            print(f"\nSelected schedule: {name}")
-            print("Times:", times)
 
-            if times:
-                print("Starting scheduler... (Ctrl+C to stop)\n")
-                ringBell(times)
-            else:
-                print("This schedule has no times.")
+# 1. Today's bell times (temporary)
+def _bell_today():
+    print("\nEnter today's bell times.")
+    print("Examples: 9, 9:30, 9am, 9:30pm, 14:00")
+    print("Type 'done' when finished.\n")
+    todays_times = _read_times()
 
-        #Saved Schedules: IF WE ENTERS 0 ITS A BUG WHERE THE LAST Saved Schedu BELL WORKS (EVERY WHERE)
-        # 3. Edit schedule (FIXED)
-        elif choice == "3":
-            names = list_schedule_names()
-            if not names:
-                print("No schedules to edit.")
-                continue
+    print("\nToday's Bell Times:", todays_times)
+    if todays_times:
+        print("Starting today-only scheduler...")
+        ringBell(todays_times, today_only=True)
+    else:
+        print("No times entered.")
 
-            print("\nSchedules:")
-            for i, n in enumerate(names):
-                print(f"{i+1}. {n}")
-            print("0. Back")
 
-            choice_idx = input("Choose: ").strip()
+# 2. Use saved schedule
+def _bell_use_saved():
+    name = _pick_schedule("Saved Schedules", "No saved schedules.")
+    if name is None:
+        return
 
-            if choice_idx == "0":
-                continue
+    times = get_schedule(name)
+    print(f"\nSelected schedule: {name}")
+    print("Times:", times)
 
-            if not choice_idx.isdigit():
-                print("Invalid choice.")
-                continue
+    if times:
+        print("Starting scheduler...")
+        ringBell(times, parsed_schedule=get_parsed_schedule(name),
+                 schedule_name=name)
+    else:
+        print("This schedule has no times.")
 
-            idx = int(choice_idx)
 
-            if idx < 1 or idx > len(names):
-                print("Invalid choice.")
-                continue
+# 3. Edit schedule
+def _bell_edit():
+    name = _pick_schedule("Schedules", "No schedules to edit.")
+    if name is None:
+        return
 
-            name = names[idx - 1]
-
-            print(f"\nEditing '{name}'")
-            print("1. Rename schedule")
-            print("2. Replace timings")
-            sub = input("Choose: ").strip()
-
-            if sub == "1":
-                new_name = input("New name: ").strip()
-                if new_name:
-                    rename_schedule(name, new_name)
-                    print("Renamed.")
-                else:
-                    print("Name cannot be empty.")
-
-            elif sub == "2":
-                print("Current times:", get_schedule(name))
-                new_times = []
-                print("Enter new times (type 'done' when finished).")
-                while True:
-                    t = input("Time: ").strip()
-                    if t.lower() == "done":
-                        break
-                    try:
-                        canonical = parse_time_to_24h(t)
-                        new_times.append(canonical)
-                    except Exception as e:
-                        print("Invalid time:", e)
-                update_schedule(name, new_times)
-                print("Timings updated.")
-
-            else:
-                print("Invalid choice.")
-
-        # 4. Create new schedule
-        elif choice == "4":
-            name = input("Schedule name: ").strip()
-            if not name:
-                print("Name cannot be empty.")
-                continue
+    print(f"\nEditing '{name}'")
+    print("1. Rename schedule")
+    print("2. Replace timings")
+    sub = input("Choose: ").strip()
 
-            times = []
-            print("Enter times for this schedule (type 'done' when finished).")
-            while True:
-                t = input("Time: ").strip()
-                if t.lower() == "done":
-                    break
-                try:
-                    canonical = parse_time_to_24h(t)
-                    times.append(canonical)
-                except Exception as e:
-                    print("Invalid time:", e)
-
-            update_schedule(name, times)
-            print(f"Schedule '{name}' created with times:", times)
-
-        # 5. Delete schedule (FIXED)
-        elif choice == "5":
-            names = list_schedule_names()
-            if not names:
-                print("No schedules to delete.")
-                continue
+    if sub == "1":
+        new_name = input("New name: ").strip()
+        if new_name:
+            rename_schedule(name, new_name)
+            print("Renamed.")
+        else:
+            print("Name cannot be empty.")
 
-            print("\nSchedules:")
-            for i, n in enumerate(names):
-                print(f"{i+1}. {n}")
-            print("0. Back")
+    elif sub == "2":
+        print("Current times:", get_schedule(name))
+        print("Enter new times (type 'done' when finished).")
+        new_times = _read_times()
+        update_schedule(name, new_times)
+        print("Timings updated.")
 
-            choice_idx = input("Choose: ").strip()
+    else:
+        print("Invalid choice.")
 
-            if choice_idx == "0":
-                continue
 
-            if not choice_idx.isdigit():
-                print("Invalid choice.")
-                continue
+# 4. Create new schedule
+def _bell_create():
+    name = input("Schedule name: ").strip()
+    if not name:
+        print("Name cannot be empty.")
+        return
 
-            idx = int(choice_idx)
+    print("Enter times for this schedule (type 'done' when finished).")
+    times = _read_times()
 
-            if idx < 1 or idx > len(names):
-                print("Invalid choice.")
-                continue
+    update_schedule(name, times)
+    print(f"Schedule '{name}' created with times:", times)
 
-            name = names[idx - 1]
 
-            confirm = input(f"Delete schedule '{name}'? (y/n): ").strip().lower()
-            if confirm == "y":
-                delete_schedule(name)
-                print("Deleted.")
-            else:
-                print("Cancelled.")
-        elif choice == "0":
-            set_mode("IDLE")
+# 5. Delete schedule
+def _bell_delete():
+    name = _pick_schedule("Schedules", "No schedules to delete.")
+    if name is None:
+        return
+
+    confirm = _prompt_lower(f"Delete schedule '{name}'? (y/n): ")
+    if confirm == "y":
+        delete_schedule(name)
+        print("Deleted.")
+    else:
+        print("Cancelled.")
+
+
+# 6. Stop the background schedule
+def _bell_stop():
+    stop_bells()
+    print("Bell schedule stopped.")
+
+
+def _leave_bell():
+    set_mode("IDLE")
+    return _BACK
+
+_BELL_ACTIONS = {
+    "1": _bell_today,
+    "2": _bell_use_saved,
+    "3": _bell_edit,
+    "4": _bell_create,
+    "5": _bell_delete,
+    "6": _bell_stop,
+    "0": _leave_bell,
+}
+
+_BELL_MENU = """
+========== BELL MODE ==========
+1. Set Today's Bell Times (only for today)
+2. Use a Saved Schedule
+3. Edit a Schedule (rename / timings)
+4. Create New Schedule
+5. Delete a Schedule
+6. Stop Running Schedule
+0. Back to Main Menu
+"""
+
+def bell_menu():
+    set_mode("BELL")
+
+    while True:
+        sys.stdout.write(_BELL_MENU)
+        sys.stdout.flush()
+
+        choice = input("Choose: ").strip()
+        if _BELL_ACTIONS.get(choice, _invalid)() is _BACK:
             return
-        else:
-            print("Invalid choice.\n")
 
 # -------------------------------------------------------------
 # Add this typewriter function
 # ------------------------------------------------------------
-def typewriter(text, delay=0.02):
-    """Print characters one by one like typing."""
+def typewriter(text, delay=0.02, frame=0.016):
+    """
+    Print characters one by one like typing.
+    Characters are flushed in batches once per `frame` seconds (~60 Hz),
+    which looks the same but needs far fewer writes than one per char.
+    """
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    buf = []
+    next_flush = time.monotonic() + frame
     for char in text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
+        buf.append(char)
+        now = time.monotonic()
+        if now >= next_flush:
+            write("".join(buf))
+            flush()
+            buf.clear()
+            next_flush = now + frame
         time.sleep(delay)
+    write("".join(buf))
+    flush()
     print()
     
+_ABOUT_CACHE = None
+
 def load_about_us():
-    try:
-        with open("about_us.txt", "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        return "About Us file (about_us.txt) not found."
+    """Read about_us.txt on first use; later calls return the cached text."""
+    global _ABOUT_CACHE
+    if _ABOUT_CACHE is None:
+        try:
+            with open("about_us.txt", "r", encoding="utf-8") as f:
+                _ABOUT_CACHE = f.read()
+        except FileNotFoundError:
+            _ABOUT_CACHE = "About Us file (about_us.txt) not found."
+    return _ABOUT_CACHE
 
 
 
@@ -698,43 +1208,48 @@ def load_about_us():
 # MAIN MENU
 # -------------------------------------------------------------
 
-def main_menu():
-    while True:
-        print("\n\t\tJOTHI - SMART BELL & ASSEMBLY SYSTEM")
-        print("\n========== MAIN MENU ==========")
-        print("1. Bell Mode")
-        print("2. Assembly")
-        print("3. Announcement")
-        print("4. Settings")
-        print("5. About Us")
-        print("0. Exit")
-        choice = input("Choose: ").strip()
-
-        if choice == "1":
-            bell_menu()
-
-        elif choice == "2":
-            assembly_menu()
-
-        elif choice == "3":
-            announcement_menu()
-
-        elif choice == "4":
-            settings_menu()
-
-        elif choice == "5":
-            print("\n========== ABOUT US ==========\n")
-            about_text = load_about_us()
-            typewriter(about_text, delay=0.01)
-            print("\n==============================\n")
-            input("Press Enter to go back.")
+def _show_about():
+    print("\n========== ABOUT US ==========\n")
+    about_text = load_about_us()
+    typewriter(about_text, delay=0.01)
+    print("\n==============================\n")
+    input("Press Enter to go back.")
+
+# choice -> action; None exits the program
+_MAIN_ACTIONS = {
+    "1": bell_menu,
+    "2": assembly_menu,
+    "3": announcement_menu,
+    "4": settings_menu,
+    "5": _show_about,
+    "0": None,
+}
 
-        elif choice == "0":
-            print("Goodbye!")
-            break
+def main_menu():
+    try:
+        while True:
+            print("\n\t\tJOTHI - SMART BELL & ASSEMBLY SYSTEM")
+            print("\n========== MAIN MENU ==========")
+            print("1. Bell Mode")
+            print("2. Assembly")
+            print("3. Announcement")
+            print("4. Settings")
+            print("5. About Us")
+            print("0. Exit")
+            choice = input("Choose: ").strip()
+
+            if choice not in _MAIN_ACTIONS:
+                print("Invalid option.\n")
+                continue
 
-        else:
-            print("Invalid option.\n")
+            action = _MAIN_ACTIONS[choice]
+            if action is None:
+                print("Goodbye!")
+                break
+            action()
+    except EOFError:
+        # end of piped input (or Ctrl+D): leave the same way as option 0
+        print("\nGoodbye!")
 
 
 # -------------------------------------------------------------